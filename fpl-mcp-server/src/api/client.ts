@@ -10,6 +10,14 @@ import type {
   SaveTeamPayload,
 } from "../types/index.js";
 
+const MAX_RETRIES = 3;
+const RETRY_BACKOFF_MS = 300;
+const RETRY_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+function sleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
 export interface FPLAuthConfig {
   cookie?: string;
   xApiAuth?: string;
@@ -19,17 +27,22 @@ export class FPLApiClient {
   private baseUrl = "https://fantasy.premierleague.com/api";
   private cookie?: string;
   private xApiAuth?: string;
+  // Request headers, built once per client
+  private headers: Record<string, string>;
+  private postHeaders: Record<string, string>;
 
   constructor(auth?: FPLAuthConfig) {
     this.cookie = auth?.cookie;
     this.xApiAuth = auth?.xApiAuth;
+    this.headers = this.buildHeaders();
+    this.postHeaders = { ...this.headers, "Content-Type": "application/json" };
   }
 
   hasAuth(): boolean {
     return Boolean(this.cookie || this.xApiAuth);
   }
 
-  private getHeaders(): Record<string, string> {
+  private buildHeaders(): Record<string, string> {
     const headers: Record<string, string> = {
       "User-Agent": "FPL-MCP-Server/1.0 (+https://fantasy.premierleague.com)",
       Origin: "https://fantasy.premierleague.com",
@@ -50,10 +63,19 @@ export class FPLApiClient {
 
   private async fetch<T>(endpoint: string): Promise<T> {
     const url = `${this.baseUrl}/${endpoint}`;
-    const response = await fetch(url, {
-      headers: this.getHeaders(),
+    let response = await fetch(url, {
+      headers: this.headers,
     });
 
+    // Retry rate limits and transient server errors with exponential backoff (GETs only)
+    for (let attempt = 0; attempt < MAX_RETRIES && RETRY_STATUSES.has(response.status); attempt++) {
+      await response.body?.cancel();
+      await sleep(RETRY_BACKOFF_MS * 2 ** attempt);
+      response = await fetch(url, {
+        headers: this.headers,
+      });
+    }
+
     if (!response.ok) {
       throw new FPLApiError(`FPL API error: ${response.status} ${response.statusText}`, response.status);
     }
@@ -94,23 +116,20 @@ export class FPLApiClient {
     }
 
     const url = `${this.baseUrl}/${endpoint}`;
-    const headers = {
-      ...this.getHeaders(),
-      "Content-Type": "application/json",
-    };
-
     const response = await fetch(url, {
       method: "POST",
-      headers,
+      headers: this.postHeaders,
       body: JSON.stringify(body),
     });
 
     if (!response.ok) {
+      // Read the body as text once, then try to parse it as JSON
+      const errorText = await response.text();
       let errorBody: unknown;
       try {
-        errorBody = await response.json();
+        errorBody = JSON.parse(errorText);
       } catch {
-        errorBody = await response.text();
+        errorBody = errorText;
       }
       throw new FPLApiError(
         `FPL API error: ${response.status} ${response.statusText} - ${JSON.stringify(errorBody)}`,
@@ -144,12 +163,33 @@ export class FPLApiError extends Error {
 
 // Helper functions
 
+// Lookups are memoized per cached source array (see cachedFetch)
+const playerLookups = new WeakMap<FPLPlayer[], Map<number, FPLPlayer>>();
+const teamLookups = new WeakMap<FPLTeam[], Map<number, FPLTeam>>();
+
 export function buildPlayerLookup(players: FPLPlayer[]): Map<number, FPLPlayer> {
-  return new Map(players.map((p) => [p.id, p]));
+  let lookup = playerLookups.get(players);
+  if (!lookup) {
+    lookup = new Map(players.map((p) => [p.id, p]));
+    playerLookups.set(players, lookup);
+  }
+  return lookup;
 }
 
 export function buildTeamLookup(teams: FPLTeam[]): Map<number, FPLTeam> {
-  return new Map(teams.map((t) => [t.id, t]));
+  let lookup = teamLookups.get(teams);
+  if (!lookup) {
+    lookup = new Map(teams.map((t) => [t.id, t]));
+    teamLookups.set(teams, lookup);
+  }
+  return lookup;
+}
+
+export function getEvent(events: FPLEvent[], gw: number): FPLEvent | undefined {
+  // Events are ordered by id (GW1..GW38); try the direct index first
+  const indexed = events[gw - 1];
+  if (indexed?.id === gw) return indexed;
+  return events.find((e) => e.id === gw);
 }
 
 export function getCurrentGameweek(events: FPLEvent[]): number {
@@ -1,9 +1,25 @@
 import Database from "better-sqlite3";
 import { existsSync, mkdirSync } from "fs";
 import { dirname } from "path";
+import { CACHE_KEYS } from "./keys.js";
+
+// Keys whose parsed values are also kept in memory. Other keys are always read from SQLite,
+// so they see invalidations by other processes sharing cache.db (e.g. my-team after a transfer)
+const MEMOIZED_KEYS: ReadonlySet<string> = new Set([CACHE_KEYS.bootstrap(), CACHE_KEYS.fixtures()]);
 
 export class FPLCache {
   private db: Database.Database;
+  // Parsed values for MEMOIZED_KEYS (see cachedFetch)
+  private memory = new Map<string, { value: unknown; expiresAt: number }>();
+  // Prepared statements
+  private statements!: {
+    get: Database.Statement;
+    set: Database.Statement;
+    invalidate: Database.Statement;
+    invalidatePattern: Database.Statement;
+    cleanup: Database.Statement;
+    clear: Database.Statement;
+  };
 
   constructor(dbPath: string = "./data/cache.db") {
     // Ensure data directory exists
@@ -27,20 +43,40 @@ export class FPLCache {
       CREATE INDEX IF NOT EXISTS idx_expires ON cache(expires_at);
     `);
 
+    this.statements = {
+      get: this.db.prepare("SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?"),
+      set: this.db.prepare(
+        `INSERT OR REPLACE INTO cache (key, value, expires_at, created_at)
+         VALUES (?, ?, ?, ?)`
+      ),
+      invalidate: this.db.prepare("DELETE FROM cache WHERE key = ?"),
+      invalidatePattern: this.db.prepare("DELETE FROM cache WHERE key LIKE ?"),
+      cleanup: this.db.prepare("DELETE FROM cache WHERE expires_at <= ?"),
+      clear: this.db.prepare("DELETE FROM cache"),
+    };
+
     // Clean up expired entries on startup
     this.cleanup();
   }
 
   get<T>(key: string): T | null {
     const now = Date.now();
-    const row = this.db
-      .prepare("SELECT value FROM cache WHERE key = ? AND expires_at > ?")
-      .get(key, now) as { value: string } | undefined;
+    const memoized = this.memory.get(key);
+    if (memoized) {
+      if (memoized.expiresAt > now) return memoized.value as T;
+      this.memory.delete(key);
+    }
+
+    const row = this.statements.get.get(key, now) as { value: string; expires_at: number } | undefined;
 
     if (!row) return null;
 
     try {
-      return JSON.parse(row.value) as T;
+      const value = JSON.parse(row.value) as T;
+      if (MEMOIZED_KEYS.has(key)) {
+        this.memory.set(key, { value: Object.freeze(value), expiresAt: row.expires_at });
+      }
+      return value;
     } catch {
       return null;
     }
@@ -50,30 +86,44 @@ export class FPLCache {
     const now = Date.now();
     const expiresAt = now + ttlMs;
 
-    this.db
-      .prepare(
-        `INSERT OR REPLACE INTO cache (key, value, expires_at, created_at)
-         VALUES (?, ?, ?, ?)`
-      )
-      .run(key, JSON.stringify(value), expiresAt, now);
+    this.statements.set.run(key, JSON.stringify(value), expiresAt, now);
+
+    // Drop expired in-memory entries
+    this.sweepMemory(now);
+
+    // Memoize the written value
+    if (MEMOIZED_KEYS.has(key)) {
+      this.memory.set(key, { value: Object.freeze(value), expiresAt });
+    }
   }
 
   invalidate(key: string): void {
-    this.db.prepare("DELETE FROM cache WHERE key = ?").run(key);
+    this.statements.invalidate.run(key);
+    this.memory.delete(key);
   }
 
   invalidatePattern(pattern: string): void {
     // Use LIKE for pattern matching
-    this.db.prepare("DELETE FROM cache WHERE key LIKE ?").run(pattern);
+    this.statements.invalidatePattern.run(pattern);
+    // Drop the in-memory layer rather than re-implementing LIKE
+    this.memory.clear();
   }
 
   cleanup(): void {
     const now = Date.now();
-    this.db.prepare("DELETE FROM cache WHERE expires_at <= ?").run(now);
+    this.statements.cleanup.run(now);
+    this.sweepMemory(now);
+  }
+
+  private sweepMemory(now: number): void {
+    for (const [key, entry] of this.memory) {
+      if (entry.expiresAt <= now) this.memory.delete(key);
+    }
   }
 
   clear(): void {
-    this.db.prepare("DELETE FROM cache").run();
+    this.statements.clear.run();
+    this.memory.clear();
   }
 
   stats(): { entries: number; size: number } {
@@ -91,7 +141,10 @@ export class FPLCache {
   }
 }
 
-// Cache-through pattern helper
+// Cache-through pattern helper.
+// Values for memoized keys (bootstrap, fixtures) are shared by every caller and keep the same
+// identity while fresh, so per-array derived data can be memoized in a WeakMap keyed on them.
+// They must be treated as read-only: the top level is frozen, nested objects are not.
 export async function cachedFetch<T>(
   cache: FPLCache,
   key: string,
@@ -0,0 +1,15 @@
+// Environment-derived settings, resolved at startup (restart the server to pick up changes)
+
+function parseManagerId(envValue: string | undefined): number | undefined {
+  if (envValue) {
+    const parsed = parseInt(envValue, 10);
+    return isNaN(parsed) ? undefined : parsed;
+  }
+  return undefined;
+}
+
+const defaultManagerId = parseManagerId(process.env.FPL_MANAGER_ID);
+
+export function getDefaultManagerId(): number | undefined {
+  return defaultManagerId;
+}
@@ -8,7 +8,7 @@ import {
 } from "@modelcontextprotocol/sdk/types.js";
 import { FPLApiClient } from "./api/client.js";
 import { FPLCache } from "./cache/sqlite.js";
-import { log, logToolCall, logToolResult, logError } from "./logger.js";
+import { log, logToolCall, logToolResult, logError, closeLog } from "./logger.js";
 import {
   getMySquadTool,
   handleGetMySquad,
@@ -75,7 +75,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
           logToolResult(name, `Returned ${result.squad.length} players`);
         }
         return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
+          content: [{ type: "text", text: JSON.stringify(result) }],
         };
       }
 
@@ -84,7 +84,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         const result = await handleGetFixtures(input, client, cache);
         logToolResult(name, `Returned ${result.fixtures.length} fixtures for GW${result.gameweek}`);
         return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
+          content: [{ type: "text", text: JSON.stringify(result) }],
         };
       }
 
@@ -93,7 +93,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         const result = await handleSearchPlayers(input, client, cache);
         logToolResult(name, `Found ${result.total_matches} matches, returned ${result.showing}`);
         return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
+          content: [{ type: "text", text: JSON.stringify(result) }],
         };
       }
 
@@ -102,7 +102,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         const result = await handleGetFixtureDifficulty(input, client, cache);
         logToolResult(name, `Analyzed ${result.team} fixtures GW${result.analysis_range.from}-${result.analysis_range.to}`);
         return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
+          content: [{ type: "text", text: JSON.stringify(result) }],
         };
       }
 
@@ -115,7 +115,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
           logToolResult(name, `Found ${result.trending_players.length} trending players`);
         }
         return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
+          content: [{ type: "text", text: JSON.stringify(result) }],
         };
       }
 
@@ -124,7 +124,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         const result = await handleMakeTransfers(input, client, cache);
         logToolResult(name, result.success ? result.message : `Error: ${result.message}`);
         return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
+          content: [{ type: "text", text: JSON.stringify(result) }],
           isError: !result.success,
         };
       }
@@ -134,7 +134,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         const result = await handleSaveTeam(input, client, cache);
         logToolResult(name, result.success ? result.message : `Error: ${result.message}`);
         return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
+          content: [{ type: "text", text: JSON.stringify(result) }],
           isError: !result.success,
         };
       }
@@ -165,7 +165,8 @@ async function main() {
   log("INFO", "FPL MCP Server connected and ready");
 }
 
-main().catch((error) => {
+main().catch(async (error) => {
   logError("Fatal", error);
+  await closeLog();
   process.exit(1);
 });
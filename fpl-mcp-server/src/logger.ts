@@ -1,4 +1,4 @@
-import { appendFileSync, mkdirSync, existsSync } from "fs";
+import { createWriteStream, mkdirSync, existsSync } from "fs";
 import { dirname } from "path";
 
 const LOG_FILE = "./data/mcp-debug.log";
@@ -9,14 +9,22 @@ if (!existsSync(dir)) {
   mkdirSync(dir, { recursive: true });
 }
 
+// Append stream for the process lifetime
+const logStream = createWriteStream(LOG_FILE, { flags: "a" });
+
+// Report log file errors (EACCES, ENOSPC, ...) on stderr instead of crashing
+logStream.on("error", (error) => {
+  process.stderr.write(`[${new Date().toISOString()}] [ERROR] Log file write failed: ${error.message}\n`);
+});
+
 export function log(level: "INFO" | "DEBUG" | "ERROR", message: string, data?: unknown): void {
   const timestamp = new Date().toISOString();
   const line = data
-    ? `[${timestamp}] [${level}] ${message} ${JSON.stringify(data, null, 2)}\n`
+    ? `[${timestamp}] [${level}] ${message} ${JSON.stringify(data)}\n`
     : `[${timestamp}] [${level}] ${message}\n`;
 
   // Write to file (Claude Code's instance)
-  appendFileSync(LOG_FILE, line);
+  logStream.write(line);
 
   // Also write to stderr (visible if running manually)
   // stdout is reserved for MCP protocol!
@@ -35,3 +43,8 @@ export function logError(context: string, error: unknown): void {
   const message = error instanceof Error ? error.message : String(error);
   log("ERROR", `${context}: ${message}`);
 }
+
+// Flush pending log writes, e.g. before process.exit()
+export function closeLog(): Promise<void> {
+  return new Promise((resolve) => logStream.end(() => resolve()));
+}
@@ -10,6 +10,7 @@ import type {
   TrendingPlayer,
   TrendingPlayerSource,
 } from "../types/index.js";
+import { POSITION_ID_MAP } from "../types/index.js";
 
 // Brave Search API response types
 interface BraveSearchResult {
@@ -176,11 +177,32 @@ const SENTIMENT_PATTERNS = {
   ],
 };
 
+// Hot topic detectors
+const HOT_TOPIC_PATTERNS = [
+  { pattern: /salah\s+vs?\s+haaland/i, topic: "Salah vs Haaland captaincy" },
+  { pattern: /\bdgw\b|double\s+gameweek/i, topic: "Double Gameweek planning" },
+  { pattern: /\bbgw\b|blank\s+gameweek/i, topic: "Blank Gameweek navigation" },
+  { pattern: /\bwc\b|wildcard/i, topic: "Wildcard timing" },
+  { pattern: /\bfh\b|free\s+hit/i, topic: "Free Hit usage" },
+  { pattern: /\bbb\b|bench\s+boost/i, topic: "Bench Boost strategy" },
+  { pattern: /\btc\b|triple\s+captain/i, topic: "Triple Captain picks" },
+  { pattern: /price\s+rise|price\s+change|price\s+drop/i, topic: "Price rises/falls" },
+  { pattern: /template/i, topic: "Template team discussion" },
+  { pattern: /rotation|roulette|bald\s+fraud/i, topic: "Rotation concerns" },
+  { pattern: /injury|injured|out\s+for/i, topic: "Injury updates" },
+  { pattern: /presser|press\s+conference/i, topic: "Press conference insights" },
+  { pattern: /\brmt\b|rate\s+my\s+team/i, topic: "Rate My Team trends" },
+  { pattern: /kneejerk|knee.?jerk/i, topic: "Kneejerk transfers warning" },
+  { pattern: /\beo\b|effective\s+ownership/i, topic: "Effective ownership analysis" },
+  { pattern: /chip\s+strateg/i, topic: "Chip strategy planning" },
+  { pattern: /captaincy\s+poll|captain\s+poll/i, topic: "Captaincy poll results" },
+];
+
 export async function handleGetCommunityTrends(
   input: GetCommunityTrendsInput,
   client: FPLApiClient,
   cache: FPLCache
-): Promise<CommunityTrendsResponse | { error: string; setup_instructions: string }> {
+): Promise<CommunityTrendsResponse | { error: string; setup_instructions: string } | { error: string; message: string }> {
   const apiKey = process.env.BRAVE_SEARCH_API_KEY;
 
   if (!apiKey) {
@@ -233,6 +255,14 @@ export async function handleGetCommunityTrends(
     }
   }
 
+  // Every search failed - report the error instead of analyzing an empty result set
+  if (queriesMade === 0) {
+    return {
+      error: "community_search_failed",
+      message: warning ?? "All community searches failed",
+    };
+  }
+
   // Parse results for player mentions and sentiment
   const trendingPlayers = extractTrendingPlayers(allResults, bootstrap.elements, position);
 
@@ -344,11 +374,18 @@ async function executeBraveSearch(
   return data.web?.results ?? [];
 }
 
-function extractTrendingPlayers(
-  results: BraveSearchResult[],
-  players: FPLPlayer[],
-  positionFilter: string | undefined
-): TrendingPlayer[] {
+interface NameMatcher {
+  player: FPLPlayer;
+  nameRegex: RegExp;
+}
+
+// Compiled matchers per cached player catalog (see cachedFetch)
+const nameMatcherCache = new WeakMap<FPLPlayer[], NameMatcher[]>();
+
+function getNameMatchers(players: FPLPlayer[]): NameMatcher[] {
+  const cached = nameMatcherCache.get(players);
+  if (cached) return cached;
+
   // Build player name lookup map
   const playerMap = new Map<string, FPLPlayer>();
   for (const player of players) {
@@ -358,14 +395,24 @@ function extractTrendingPlayers(
     playerMap.set(player.second_name.toLowerCase(), player);
   }
 
-  // Position mapping
-  const positionTypeMap: Record<string, number> = {
-    GK: 1,
-    DEF: 2,
-    MID: 3,
-    FWD: 4,
-  };
+  // Word boundary matching prevents matching "adli" inside "deadline" or "headline"
+  const matchers: NameMatcher[] = [];
+  for (const [name, player] of playerMap) {
+    // Skip names shorter than 3 characters
+    if (name.length < 3) continue;
+
+    matchers.push({ player, nameRegex: new RegExp(`\\b${escapeRegExp(name)}\\b`, "i") });
+  }
+
+  nameMatcherCache.set(players, matchers);
+  return matchers;
+}
 
+function extractTrendingPlayers(
+  results: BraveSearchResult[],
+  players: FPLPlayer[],
+  positionFilter: string | undefined
+): TrendingPlayer[] {
   // Track player mentions
   const mentions = new Map<
     string,
@@ -375,67 +422,75 @@ function extractTrendingPlayers(
       sentimentScores: Record<string, number>;
       reasons: Set<string>;
       sources: TrendingPlayerSource[];
+      sourceUrls: Set<string>;
     }
   >();
 
+  const matchers = getNameMatchers(players);
+  const positionType = positionFilter ? POSITION_ID_MAP[positionFilter] : undefined;
+  // Skip players whose position doesn't match the filter
+  const candidates = positionFilter
+    ? matchers.filter(({ player }) => player.element_type === positionType)
+    : matchers;
+
   for (const result of results) {
     const text = `${result.title} ${result.description}`.toLowerCase();
 
+    // Sentiment phrases and source type for this result, worked out on the first player mention
+    let matchedSentiments: Array<[sentiment: string, pattern: string]> | undefined;
+    let sourceType: TrendingPlayerSource["source_type"] = "other";
+
     // Check each player
-    for (const [name, player] of playerMap) {
-      // Skip if position filter doesn't match
-      if (positionFilter && player.element_type !== positionTypeMap[positionFilter]) {
-        continue;
-      }
+    for (const { player, nameRegex } of candidates) {
+      // Check if player is mentioned
+      if (!nameRegex.test(text)) continue;
+
+      if (!matchedSentiments) {
+        // Analyze sentiment
+        matchedSentiments = [];
+        for (const [sentiment, patterns] of Object.entries(SENTIMENT_PATTERNS)) {
+          for (const pattern of patterns) {
+            if (text.includes(pattern)) matchedSentiments.push([sentiment, pattern]);
+          }
+        }
 
-      // Check if player is mentioned using word boundary matching
-      // This prevents matching "adli" inside "deadline" or "headline"
-      if (name.length >= 3) {
-        const nameRegex = new RegExp(`\\b${escapeRegExp(name)}\\b`, "i");
-        if (!nameRegex.test(text)) continue;
-      } else {
-        continue; // Skip names shorter than 3 characters
+        // Determine source type
+        if (result.url.includes("reddit.com")) sourceType = "reddit";
+        else if (result.url.includes("twitter.com") || result.url.includes("x.com")) sourceType = "twitter";
+        else if (
+          result.url.includes("fantasyfootballscout") ||
+          result.url.includes("fplstatistics") ||
+          result.url.includes("thefplwire") ||
+          result.url.includes("blog")
+        )
+          sourceType = "blog";
       }
 
       const key = player.web_name;
 
-      if (!mentions.has(key)) {
-        mentions.set(key, {
+      let data = mentions.get(key);
+      if (!data) {
+        data = {
           player,
           count: 0,
           sentimentScores: { buy: 0, sell: 0, hold: 0, watch: 0 },
           reasons: new Set(),
           sources: [],
-        });
+          sourceUrls: new Set(),
+        };
+        mentions.set(key, data);
       }
 
-      const data = mentions.get(key)!;
       data.count++;
 
-      // Analyze sentiment
-      for (const [sentiment, patterns] of Object.entries(SENTIMENT_PATTERNS)) {
-        for (const pattern of patterns) {
-          if (text.includes(pattern)) {
-            data.sentimentScores[sentiment]++;
-            data.reasons.add(pattern);
-          }
-        }
+      for (const [sentiment, pattern] of matchedSentiments) {
+        data.sentimentScores[sentiment]++;
+        data.reasons.add(pattern);
       }
 
-      // Determine source type
-      let sourceType: TrendingPlayerSource["source_type"] = "other";
-      if (result.url.includes("reddit.com")) sourceType = "reddit";
-      else if (result.url.includes("twitter.com") || result.url.includes("x.com")) sourceType = "twitter";
-      else if (
-        result.url.includes("fantasyfootballscout") ||
-        result.url.includes("fplstatistics") ||
-        result.url.includes("thefplwire") ||
-        result.url.includes("blog")
-      )
-        sourceType = "blog";
-
       // Avoid duplicate sources
-      if (!data.sources.some((s) => s.url === result.url)) {
+      if (!data.sourceUrls.has(result.url)) {
+        data.sourceUrls.add(result.url);
         data.sources.push({
           title: result.title,
           url: result.url,
@@ -445,10 +500,11 @@ function extractTrendingPlayers(
     }
   }
 
-  // Convert to trending players array
-  const trendingPlayers: TrendingPlayer[] = [];
+  // Top 10 by mention count
+  const topMentions = [...mentions.values()].sort((a, b) => b.count - a.count).slice(0, 10);
 
-  for (const [, data] of mentions) {
+  // Convert to trending players array
+  return topMentions.map((data) => {
     // Determine dominant sentiment
     const scores = data.sentimentScores;
     const maxScore = Math.max(scores.buy, scores.sell, scores.hold, scores.watch);
@@ -461,50 +517,24 @@ function extractTrendingPlayers(
       else sentiment = "watch";
     }
 
-    trendingPlayers.push({
+    return {
       player_name: data.player.web_name,
       player_id: data.player.id,
       sentiment,
       mentions: data.count,
       reasons: Array.from(data.reasons).slice(0, 5),
       sources: data.sources.slice(0, 3),
-    });
-  }
-
-  // Sort by mention count
-  trendingPlayers.sort((a, b) => b.mentions - a.mentions);
-
-  // Return top 10
-  return trendingPlayers.slice(0, 10);
+    };
+  });
 }
 
 function extractHotTopics(results: BraveSearchResult[]): string[] {
-  const topicPatterns = [
-    { pattern: /salah\s+vs?\s+haaland/i, topic: "Salah vs Haaland captaincy" },
-    { pattern: /\bdgw\b|double\s+gameweek/i, topic: "Double Gameweek planning" },
-    { pattern: /\bbgw\b|blank\s+gameweek/i, topic: "Blank Gameweek navigation" },
-    { pattern: /\bwc\b|wildcard/i, topic: "Wildcard timing" },
-    { pattern: /\bfh\b|free\s+hit/i, topic: "Free Hit usage" },
-    { pattern: /\bbb\b|bench\s+boost/i, topic: "Bench Boost strategy" },
-    { pattern: /\btc\b|triple\s+captain/i, topic: "Triple Captain picks" },
-    { pattern: /price\s+rise|price\s+change|price\s+drop/i, topic: "Price rises/falls" },
-    { pattern: /template/i, topic: "Template team discussion" },
-    { pattern: /rotation|roulette|bald\s+fraud/i, topic: "Rotation concerns" },
-    { pattern: /injury|injured|out\s+for/i, topic: "Injury updates" },
-    { pattern: /presser|press\s+conference/i, topic: "Press conference insights" },
-    { pattern: /\brmt\b|rate\s+my\s+team/i, topic: "Rate My Team trends" },
-    { pattern: /kneejerk|knee.?jerk/i, topic: "Kneejerk transfers warning" },
-    { pattern: /\beo\b|effective\s+ownership/i, topic: "Effective ownership analysis" },
-    { pattern: /chip\s+strateg/i, topic: "Chip strategy planning" },
-    { pattern: /captaincy\s+poll|captain\s+poll/i, topic: "Captaincy poll results" },
-  ];
-
   const foundTopics = new Set<string>();
 
   for (const result of results) {
     const text = `${result.title} ${result.description}`;
 
-    for (const { pattern, topic } of topicPatterns) {
+    for (const { pattern, topic } of HOT_TOPIC_PATTERNS) {
       if (pattern.test(text)) {
         foundTopics.add(topic);
       }
@@ -58,7 +58,12 @@ export async function handleGetFixtureDifficulty(
   const teamShort = input.team.toUpperCase();
   const numGameweeks = input.gameweeks ?? 6;
 
-  // Fetch bootstrap data
+  // Fetch bootstrap data and all fixtures in parallel
+  const fixturesRequest = cachedFetch<FPLFixture[]>(cache, CACHE_KEYS.fixtures(), TTL.FIXTURES, () =>
+    client.getFixtures()
+  );
+  // Awaited after the team check; avoids an unhandled rejection if we throw first
+  fixturesRequest.catch(() => {});
   const bootstrap = await cachedFetch<BootstrapStatic>(cache, CACHE_KEYS.bootstrap(), TTL.BOOTSTRAP, () =>
     client.getBootstrapStatic()
   );
@@ -73,10 +78,7 @@ export async function handleGetFixtureDifficulty(
     throw new Error(`Team not found: ${teamShort}. Valid teams: ${bootstrap.teams.map((t) => t.short_name).join(", ")}`);
   }
 
-  // Fetch all fixtures
-  const allFixtures = await cachedFetch<FPLFixture[]>(cache, CACHE_KEYS.fixtures(), TTL.FIXTURES, () =>
-    client.getFixtures()
-  );
+  const allFixtures = await fixturesRequest;
 
   // Get fixtures for this team in the range
   const teamFixtures = getTeamFixturesInRange(team.id, fromGw, toGw, allFixtures, teamLookup);
@@ -110,10 +112,17 @@ function getTeamFixturesInRange(
 ): GWFixture[] {
   const result: GWFixture[] = [];
 
+  // Group this team's fixtures by gameweek
+  const fixturesByGw = new Map<number, FPLFixture[]>();
+  for (const f of allFixtures) {
+    if (f.event === null || (f.team_h !== teamId && f.team_a !== teamId)) continue;
+    const bucket = fixturesByGw.get(f.event);
+    if (bucket) bucket.push(f);
+    else fixturesByGw.set(f.event, [f]);
+  }
+
   for (let gw = fromGw; gw <= toGw; gw++) {
-    const gwFixtures = allFixtures.filter(
-      (f) => f.event === gw && (f.team_h === teamId || f.team_a === teamId)
-    );
+    const gwFixtures = fixturesByGw.get(gw) ?? [];
 
     if (gwFixtures.length === 0) {
       // Blank gameweek
@@ -178,7 +187,21 @@ function getTeamFixturesInRange(
 function calculateSummary(fixtures: GWFixture[], fromGw: number, toGw: number) {
   const blankGws: number[] = [];
   const doubleGws: number[] = [];
-  const fdrValues: number[] = [];
+
+  // Running totals and difficulty buckets
+  let fdrSum = 0;
+  let fdrCount = 0;
+  let easyFixtures = 0;
+  let mediumFixtures = 0;
+  let hardFixtures = 0;
+
+  const addFdr = (fdr: number) => {
+    fdrSum += fdr;
+    fdrCount++;
+    if (fdr <= 2) easyFixtures++;
+    else if (fdr === 3) mediumFixtures++;
+    else if (fdr >= 4) hardFixtures++;
+  };
 
   for (const f of fixtures) {
     if (f.fdr === null) {
@@ -187,27 +210,64 @@ function calculateSummary(fixtures: GWFixture[], fromGw: number, toGw: number) {
       doubleGws.push(f.gw);
       // Add all FDR values from double GW
       for (const detail of f.all_fixtures) {
-        fdrValues.push(detail.fdr);
+        addFdr(detail.fdr);
       }
     } else {
-      fdrValues.push(f.fdr);
+      addFdr(f.fdr);
     }
   }
 
-  const avgFdr = fdrValues.length > 0
-    ? Math.round((fdrValues.reduce((a, b) => a + b, 0) / fdrValues.length) * 10) / 10
+  const avgFdr = fdrCount > 0
+    ? Math.round((fdrSum / fdrCount) * 10) / 10
     : 0;
 
   return {
     average_fdr: avgFdr,
-    easy_fixtures: fdrValues.filter((f) => f <= 2).length,
-    medium_fixtures: fdrValues.filter((f) => f === 3).length,
-    hard_fixtures: fdrValues.filter((f) => f >= 4).length,
+    easy_fixtures: easyFixtures,
+    medium_fixtures: mediumFixtures,
+    hard_fixtures: hardFixtures,
     blank_gameweeks: blankGws,
     double_gameweeks: doubleGws,
   };
 }
 
+interface FdrTotals {
+  fdrSums: Float64Array;
+  fdrCounts: Uint16Array;
+}
+
+// League-wide FDR totals per cached fixtures array, keyed by "fromGw-toGw"
+const fdrTotalsCache = new WeakMap<FPLFixture[], Map<string, FdrTotals>>();
+
+function getFdrTotals(allFixtures: FPLFixture[], fromGw: number, toGw: number): FdrTotals {
+  let byRange = fdrTotalsCache.get(allFixtures);
+  if (!byRange) {
+    byRange = new Map();
+    fdrTotalsCache.set(allFixtures, byRange);
+  }
+
+  const rangeKey = `${fromGw}-${toGw}`;
+  const cached = byRange.get(rangeKey);
+  if (cached) return cached;
+
+  // Accumulate FDR sums and counts per team id
+  const maxTeamId = allFixtures.reduce((max, f) => Math.max(max, f.team_h, f.team_a), 0);
+  const fdrSums = new Float64Array(maxTeamId + 1);
+  const fdrCounts = new Uint16Array(maxTeamId + 1);
+
+  for (const f of allFixtures) {
+    if (f.event === null || f.event < fromGw || f.event > toGw) continue;
+    fdrSums[f.team_h] += f.team_h_difficulty;
+    fdrCounts[f.team_h]++;
+    fdrSums[f.team_a] += f.team_a_difficulty;
+    fdrCounts[f.team_a]++;
+  }
+
+  const totals = { fdrSums, fdrCounts };
+  byRange.set(rangeKey, totals);
+  return totals;
+}
+
 function calculateComparison(
   teamId: number,
   fromGw: number,
@@ -216,29 +276,14 @@ function calculateComparison(
   teams: FPLTeam[],
   teamLookup: Map<number, FPLTeam>
 ) {
-  // Calculate average FDR for each team
-  const teamFdrs: { teamId: number; shortName: string; avgFdr: number }[] = [];
-
-  for (const t of teams) {
-    const fdrValues: number[] = [];
-
-    for (let gw = fromGw; gw <= toGw; gw++) {
-      const gwFixtures = allFixtures.filter(
-        (f) => f.event === gw && (f.team_h === t.id || f.team_a === t.id)
-      );
+  const { fdrSums, fdrCounts } = getFdrTotals(allFixtures, fromGw, toGw);
 
-      for (const f of gwFixtures) {
-        const isHome = f.team_h === t.id;
-        fdrValues.push(isHome ? f.team_h_difficulty : f.team_a_difficulty);
-      }
-    }
-
-    const avgFdr = fdrValues.length > 0
-      ? fdrValues.reduce((a, b) => a + b, 0) / fdrValues.length
-      : 5; // Penalize teams with no fixtures
-
-    teamFdrs.push({ teamId: t.id, shortName: t.short_name, avgFdr });
-  }
+  // Calculate average FDR for each team
+  const teamFdrs: { teamId: number; shortName: string; avgFdr: number }[] = teams.map((t) => ({
+    teamId: t.id,
+    shortName: t.short_name,
+    avgFdr: fdrCounts[t.id] > 0 ? fdrSums[t.id] / fdrCounts[t.id] : 5, // Penalize teams with no fixtures
+  }));
 
   // Sort by FDR (lower = easier = better)
   teamFdrs.sort((a, b) => a.avgFdr - b.avgFdr);
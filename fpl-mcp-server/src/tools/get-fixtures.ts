@@ -1,6 +1,6 @@
 import { z } from "zod";
 import type { FPLApiClient } from "../api/client.js";
-import { buildTeamLookup, getCurrentGameweek } from "../api/client.js";
+import { buildTeamLookup, getCurrentGameweek, getEvent } from "../api/client.js";
 import { FPLCache, cachedFetch } from "../cache/sqlite.js";
 import { TTL, CACHE_KEYS } from "../cache/keys.js";
 import type { EnrichedFixture, FixturesResponse, BootstrapStatic, FPLFixture, FPLEvent } from "../types/index.js";
@@ -36,32 +36,27 @@ export async function handleGetFixtures(
   client: FPLApiClient,
   cache: FPLCache
 ): Promise<FixturesResponse> {
-  // Fetch bootstrap for team names and current gameweek
-  const bootstrap = await cachedFetch<BootstrapStatic>(cache, CACHE_KEYS.bootstrap(), TTL.BOOTSTRAP, () =>
-    client.getBootstrapStatic()
-  );
+  // Fetch bootstrap (team names, current gameweek) and all fixtures in parallel (both cached)
+  const [bootstrap, allFixtures] = await Promise.all([
+    cachedFetch<BootstrapStatic>(cache, CACHE_KEYS.bootstrap(), TTL.BOOTSTRAP, () => client.getBootstrapStatic()),
+    cachedFetch<FPLFixture[]>(cache, CACHE_KEYS.fixtures(), TTL.FIXTURES, () => client.getFixtures()),
+  ]);
 
   const teamLookup = buildTeamLookup(bootstrap.teams);
   const targetGw = input.gameweek ?? getCurrentGameweek(bootstrap.events);
 
-  // Fetch all fixtures (cached)
-  const allFixtures = await cachedFetch<FPLFixture[]>(cache, CACHE_KEYS.fixtures(), TTL.FIXTURES, () =>
-    client.getFixtures()
-  );
-
   // Filter by gameweek first (for accurate blank/playing calculation)
   const gwFixtures = allFixtures.filter((f) => f.event === targetGw);
 
   // Calculate which teams are truly blank THIS gameweek (before any team filter)
-  const allTeamIds = new Set(bootstrap.teams.map((t) => t.id));
-  const allTeamsPlayingThisGw = new Set<number>();
+  // Flag playing teams in an array indexed by team id
+  const maxTeamId = bootstrap.teams.reduce((max, t) => Math.max(max, t.id), 0);
+  const playingThisGw = new Uint8Array(maxTeamId + 1);
   for (const f of gwFixtures) {
-    allTeamsPlayingThisGw.add(f.team_h);
-    allTeamsPlayingThisGw.add(f.team_a);
+    playingThisGw[f.team_h] = 1;
+    playingThisGw[f.team_a] = 1;
   }
-  const teamsBlank = [...allTeamIds]
-    .filter((id) => !allTeamsPlayingThisGw.has(id))
-    .map((id) => teamLookup.get(id)?.short_name ?? "???");
+  const teamsBlank = bootstrap.teams.filter((t) => !playingThisGw[t.id]).map((t) => t.short_name);
 
   // Now apply team filter for the response fixtures
   let fixtures = gwFixtures;
@@ -69,7 +64,7 @@ export async function handleGetFixtures(
 
   if (input.team) {
     const teamShort = input.team.toUpperCase();
-    const teamId = [...teamLookup.entries()].find(([, t]) => t.short_name === teamShort)?.[0];
+    const teamId = bootstrap.teams.find((t) => t.short_name === teamShort)?.id;
 
     if (teamId) {
       fixtures = fixtures.filter((f) => f.team_h === teamId || f.team_a === teamId);
@@ -99,7 +94,7 @@ export async function handleGetFixtures(
   });
 
   // Get event info for deadline
-  const event = bootstrap.events.find((e) => e.id === targetGw);
+  const event = getEvent(bootstrap.events, targetGw);
 
   return {
     gameweek: targetGw,
@@ -107,7 +102,7 @@ export async function handleGetFixtures(
     is_current: event?.is_current ?? false,
     is_finished: event?.finished ?? false,
     fixtures: enrichedFixtures,
-    teams_playing: enrichedFixtures.flatMap((f) => [f.home_team, f.away_team]).filter((v, i, a) => a.indexOf(v) === i),
+    teams_playing: [...new Set(enrichedFixtures.flatMap((f) => [f.home_team, f.away_team]))],
     teams_blank: teamsBlank,
     filter: appliedFilter,
   };
@@ -3,6 +3,7 @@ import type { FPLApiClient } from "../api/client.js";
 import { buildPlayerLookup, buildTeamLookup, getCurrentGameweek } from "../api/client.js";
 import { FPLCache, cachedFetch } from "../cache/sqlite.js";
 import { TTL, CACHE_KEYS } from "../cache/keys.js";
+import { getDefaultManagerId } from "../config.js";
 import type {
   EnrichedPlayer,
   SquadResponse,
@@ -16,15 +17,6 @@ import type {
 } from "../types/index.js";
 import { POSITION_MAP, toMillions } from "../types/index.js";
 
-function getDefaultManagerId(): number | undefined {
-  const envValue = process.env.FPL_MANAGER_ID;
-  if (envValue) {
-    const parsed = parseInt(envValue, 10);
-    return isNaN(parsed) ? undefined : parsed;
-  }
-  return undefined;
-}
-
 export const getMySquadSchema = z.object({
   manager_id: z.number().optional().describe("Your FPL manager ID. Optional if FPL_MANAGER_ID env var is set."),
 });
@@ -74,19 +66,24 @@ export async function handleGetMySquad(
     };
   }
 
-  // Fetch bootstrap data (cached 24h)
-  const bootstrap = await cachedFetch<BootstrapStatic>(cache, CACHE_KEYS.bootstrap(), TTL.BOOTSTRAP, () =>
-    client.getBootstrapStatic()
-  );
+  // Authenticated my-team, fetched alongside bootstrap/fixtures. Null without auth or on failure
+  // (public picks are used instead), so an early throw never leaves it unhandled.
+  const myTeamRequest: Promise<MyTeamResponse | null> = client.hasAuth()
+    ? cachedFetch<MyTeamResponse>(cache, CACHE_KEYS.myTeam(manager_id), TTL.MY_TEAM, () =>
+        client.getMyTeam(manager_id)
+      ).catch(() => null)
+    : Promise.resolve(null);
+
+  // Fetch bootstrap data (cached 24h) and fixtures for next fixture info in parallel
+  const [bootstrap, fixtures] = await Promise.all([
+    cachedFetch<BootstrapStatic>(cache, CACHE_KEYS.bootstrap(), TTL.BOOTSTRAP, () => client.getBootstrapStatic()),
+    cachedFetch<FPLFixture[]>(cache, CACHE_KEYS.fixtures(), TTL.FIXTURES, () => client.getFixtures()),
+  ]);
 
   const playerLookup = buildPlayerLookup(bootstrap.elements);
   const teamLookup = buildTeamLookup(bootstrap.teams);
   const currentGw = getCurrentGameweek(bootstrap.events);
-
-  // Fetch fixtures for next fixture info
-  const fixtures = await cachedFetch<FPLFixture[]>(cache, CACHE_KEYS.fixtures(), TTL.FIXTURES, () =>
-    client.getFixtures()
-  );
+  const nextFixtureByTeam = indexFixturesByTeam(fixtures, currentGw);
 
   // Try authenticated my-team first, fall back to public picks
   let picks: FPLPick[];
@@ -99,14 +96,10 @@ export async function handleGetMySquad(
   let staleWarning: string | undefined;
   let gameweekFetched: number | undefined;
 
-  try {
-    const myTeam = await cachedFetch<MyTeamResponse>(
-      cache,
-      CACHE_KEYS.myTeam(manager_id),
-      TTL.MY_TEAM,
-      () => client.getMyTeam(manager_id)
-    );
+  const myTeam = await myTeamRequest;
 
+  // Only trust a my-team payload that has picks, transfers and chips
+  if (myTeam && Array.isArray(myTeam.picks) && myTeam.transfers && Array.isArray(myTeam.chips)) {
     picks = myTeam.picks;
     bank = toMillions(myTeam.transfers.bank);
     freeTransfers = (myTeam.transfers.limit ?? 1) - myTeam.transfers.made;
@@ -115,7 +108,7 @@ export async function handleGetMySquad(
       .map((c) => c.name);
     dataSourceType = "authenticated";
     isStale = false;
-  } catch {
+  } else {
     // Fall back to public picks endpoint
     const publicPicks = await cachedFetch<PicksResponse>(
       cache,
@@ -149,16 +142,25 @@ It does NOT show:
 ⚠️⚠️⚠️ DO NOT TRUST THIS DATA FOR TRANSFER DECISIONS ⚠️⚠️⚠️`;
   }
 
-  // Enrich picks with player data
-  const enrichedPlayers: EnrichedPlayer[] = picks.map((pick) => {
+  // Enrich picks with player data: split XI/bench, find captaincy, count clubs (3-per-club rule)
+  // and total squad value
+  const enrichedPlayers: EnrichedPlayer[] = [];
+  const startingXi: EnrichedPlayer[] = [];
+  const bench: EnrichedPlayer[] = [];
+  let captain: EnrichedPlayer | undefined;
+  let viceCaptain: EnrichedPlayer | undefined;
+  const clubCounts: Record<string, number> = {};
+  let totalSquadValue = 0;
+
+  for (const pick of picks) {
     const player = playerLookup.get(pick.element);
     const team = player ? teamLookup.get(player.team) : undefined;
-    const nextFixture = getNextFixture(player?.team, currentGw, fixtures, teamLookup);
+    const nextFixture = getNextFixture(player?.team, nextFixtureByTeam, teamLookup);
 
     const inStartingXi = pick.multiplier > 0;
     const benchOrder = !inStartingXi ? pick.position - 11 : null;
 
-    return {
+    const enriched: EnrichedPlayer = {
       id: pick.element,
       name: player?.web_name ?? "Unknown",
       full_name: player ? `${player.first_name} ${player.second_name}` : "Unknown",
@@ -180,21 +182,17 @@ It does NOT show:
       total_points: player?.total_points ?? 0,
       next_fixture: nextFixture,
     };
-  });
-
-  const startingXi = enrichedPlayers.filter((p) => p.in_starting_xi);
-  const bench = enrichedPlayers.filter((p) => !p.in_starting_xi).sort((a, b) => (a.bench_order ?? 0) - (b.bench_order ?? 0));
-
-  const captain = enrichedPlayers.find((p) => p.is_captain);
-  const viceCaptain = enrichedPlayers.find((p) => p.is_vice_captain);
 
-  // Calculate club counts for 3-per-club rule
-  const clubCounts: Record<string, number> = {};
-  for (const player of enrichedPlayers) {
-    clubCounts[player.team] = (clubCounts[player.team] ?? 0) + 1;
+    enrichedPlayers.push(enriched);
+    if (inStartingXi) startingXi.push(enriched);
+    else bench.push(enriched);
+    if (enriched.is_captain && !captain) captain = enriched;
+    if (enriched.is_vice_captain && !viceCaptain) viceCaptain = enriched;
+    clubCounts[enriched.team] = (clubCounts[enriched.team] ?? 0) + 1;
+    totalSquadValue += enriched.cost;
   }
 
-  const totalSquadValue = enrichedPlayers.reduce((sum, p) => sum + p.cost, 0);
+  bench.sort((a, b) => (a.bench_order ?? 0) - (b.bench_order ?? 0));
 
   return {
     squad: enrichedPlayers,
@@ -222,17 +220,25 @@ It does NOT show:
   };
 }
 
+// First fixture of the gameweek for each team
+function indexFixturesByTeam(fixtures: FPLFixture[], gw: number): Map<number, FPLFixture> {
+  const byTeam = new Map<number, FPLFixture>();
+  for (const f of fixtures) {
+    if (f.event !== gw) continue;
+    if (!byTeam.has(f.team_h)) byTeam.set(f.team_h, f);
+    if (!byTeam.has(f.team_a)) byTeam.set(f.team_a, f);
+  }
+  return byTeam;
+}
+
 function getNextFixture(
   teamId: number | undefined,
-  currentGw: number,
-  fixtures: FPLFixture[],
+  nextFixtureByTeam: Map<number, FPLFixture>,
   teamLookup: Map<number, FPLTeam>
 ): EnrichedPlayer["next_fixture"] | undefined {
   if (!teamId) return undefined;
 
-  const nextFixture = fixtures.find(
-    (f) => f.event === currentGw && (f.team_h === teamId || f.team_a === teamId)
-  );
+  const nextFixture = nextFixtureByTeam.get(teamId);
 
   if (!nextFixture) return undefined;
 
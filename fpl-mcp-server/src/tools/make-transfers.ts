@@ -2,17 +2,9 @@ import { z } from "zod";
 import type { FPLApiClient } from "../api/client.js";
 import { FPLCache } from "../cache/sqlite.js";
 import { CACHE_KEYS } from "../cache/keys.js";
+import { getDefaultManagerId } from "../config.js";
 import type { TransferPayload } from "../types/index.js";
 
-function getDefaultManagerId(): number | undefined {
-  const envValue = process.env.FPL_MANAGER_ID;
-  if (envValue) {
-    const parsed = parseInt(envValue, 10);
-    return isNaN(parsed) ? undefined : parsed;
-  }
-  return undefined;
-}
-
 const transferItemSchema = z.object({
   element_in: z.number().describe("Player ID to buy"),
   element_out: z.number().describe("Player ID to sell"),
@@ -2,17 +2,9 @@ import { z } from "zod";
 import type { FPLApiClient } from "../api/client.js";
 import { FPLCache } from "../cache/sqlite.js";
 import { CACHE_KEYS } from "../cache/keys.js";
+import { getDefaultManagerId } from "../config.js";
 import type { SaveTeamPayload, SaveTeamPick } from "../types/index.js";
 
-function getDefaultManagerId(): number | undefined {
-  const envValue = process.env.FPL_MANAGER_ID;
-  if (envValue) {
-    const parsed = parseInt(envValue, 10);
-    return isNaN(parsed) ? undefined : parsed;
-  }
-  return undefined;
-}
-
 const pickSchema = z.object({
   element: z.number().describe("Player ID"),
   position: z.number().min(1).max(15).describe("Squad position (1-11 = starting XI, 12-15 = bench)"),
@@ -102,25 +94,30 @@ export async function handleSaveTeam(
     };
   }
 
-  // Validate picks
+  // Validate picks (saveTeamSchema already guarantees exactly 15 of them)
   const picks = input.picks;
 
-  if (picks.length !== 15) {
-    return { success: false, message: `Expected 15 picks, got ${picks.length}` };
+  // Collect positions, captains and vice captains in one pass over the picks
+  const seenPositions = new Set<number>();
+  let positionsValid = true;
+  const captains: SaveTeamInput["picks"] = [];
+  const viceCaptains: SaveTeamInput["picks"] = [];
+  for (const p of picks) {
+    if (!Number.isInteger(p.position)) positionsValid = false;
+    seenPositions.add(p.position);
+    if (p.is_captain) captains.push(p);
+    if (p.is_vice_captain) viceCaptains.push(p);
   }
 
-  const positions = picks.map((p) => p.position).sort((a, b) => a - b);
-  const expectedPositions = Array.from({ length: 15 }, (_, i) => i + 1);
-  if (JSON.stringify(positions) !== JSON.stringify(expectedPositions)) {
+  // Schema bounds positions to 1-15, so 15 distinct integers means each is used exactly once
+  if (!positionsValid || seenPositions.size !== 15) {
     return { success: false, message: "Picks must have positions 1 through 15, each used exactly once." };
   }
 
-  const captains = picks.filter((p) => p.is_captain);
   if (captains.length !== 1) {
     return { success: false, message: `Expected exactly 1 captain, got ${captains.length}` };
   }
 
-  const viceCaptains = picks.filter((p) => p.is_vice_captain);
   if (viceCaptains.length !== 1) {
     return { success: false, message: `Expected exactly 1 vice captain, got ${viceCaptains.length}` };
   }
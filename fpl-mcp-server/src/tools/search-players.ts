@@ -4,7 +4,7 @@ import { buildTeamLookup, getCurrentGameweek } from "../api/client.js";
 import { FPLCache, cachedFetch } from "../cache/sqlite.js";
 import { TTL, CACHE_KEYS } from "../cache/keys.js";
 import type { SearchPlayersResponse, BootstrapStatic, FPLFixture, FPLPlayer, FPLTeam } from "../types/index.js";
-import { POSITION_MAP, toMillions } from "../types/index.js";
+import { POSITION_MAP, POSITION_ID_MAP, toMillions } from "../types/index.js";
 
 export const searchPlayersSchema = z.object({
   query: z.string().optional().describe("Search by player name (partial match)"),
@@ -72,104 +72,78 @@ export const searchPlayersTool = {
   },
 };
 
-const POSITION_MAP_REVERSE: Record<string, number> = {
-  GK: 1,
-  DEF: 2,
-  MID: 3,
-  FWD: 4,
-};
-
 export async function handleSearchPlayers(
   input: SearchPlayersInput,
   client: FPLApiClient,
   cache: FPLCache
 ): Promise<SearchPlayersResponse> {
-  // Fetch bootstrap data (cached)
-  const bootstrap = await cachedFetch<BootstrapStatic>(cache, CACHE_KEYS.bootstrap(), TTL.BOOTSTRAP, () =>
-    client.getBootstrapStatic()
-  );
+  // Fetch bootstrap data and fixtures for next fixtures in parallel (both cached)
+  const [bootstrap, allFixtures] = await Promise.all([
+    cachedFetch<BootstrapStatic>(cache, CACHE_KEYS.bootstrap(), TTL.BOOTSTRAP, () => client.getBootstrapStatic()),
+    cachedFetch<FPLFixture[]>(cache, CACHE_KEYS.fixtures(), TTL.FIXTURES, () => client.getFixtures()),
+  ]);
 
   const teamLookup = buildTeamLookup(bootstrap.teams);
   const currentGw = getCurrentGameweek(bootstrap.events);
 
-  // Fetch fixtures for next fixtures
-  const allFixtures = await cachedFetch<FPLFixture[]>(cache, CACHE_KEYS.fixtures(), TTL.FIXTURES, () =>
-    client.getFixtures()
-  );
-
-  let players = [...bootstrap.elements];
-
-  // Apply filters
-  if (input.query) {
-    const q = input.query.toLowerCase();
-    players = players.filter(
-      (p) =>
-        p.web_name.toLowerCase().includes(q) ||
-        p.first_name.toLowerCase().includes(q) ||
-        p.second_name.toLowerCase().includes(q)
-    );
-  }
-
-  if (input.position) {
-    const positionId = POSITION_MAP_REVERSE[input.position];
-    players = players.filter((p) => p.element_type === positionId);
-  }
+  // Resolve filter parameters
+  const q = input.query?.toLowerCase();
+  const positionId = input.position ? POSITION_ID_MAP[input.position] : undefined;
 
+  let teamId: number | undefined;
   if (input.team) {
     const teamShort = input.team.toUpperCase();
-    const teamId = [...teamLookup.entries()].find(([, t]) => t.short_name === teamShort)?.[0];
-    if (teamId) {
-      players = players.filter((p) => p.team === teamId);
-    }
+    teamId = bootstrap.teams.find((t) => t.short_name === teamShort)?.id;
   }
 
-  if (input.max_price !== undefined) {
-    const maxCost = input.max_price * 10;
-    players = players.filter((p) => p.now_cost <= maxCost);
-  }
+  const maxCost = input.max_price !== undefined ? input.max_price * 10 : undefined;
+  const minCost = input.min_price !== undefined ? input.min_price * 10 : undefined;
+  const minForm = input.min_form;
+  const minMinutes = input.min_minutes;
 
-  if (input.min_price !== undefined) {
-    const minCost = input.min_price * 10;
-    players = players.filter((p) => p.now_cost >= minCost);
-  }
+  // Apply filters and collect each match's sort key (form is parsed once for min_form and sorting)
+  const sortBy = input.sort_by ?? "form";
+  const needsForm = minForm !== undefined || sortBy === "form";
+  const players: FPLPlayer[] = [];
+  const keys: number[] = [];
+
+  for (const p of bootstrap.elements) {
+    if (
+      q &&
+      !(
+        p.web_name.toLowerCase().includes(q) ||
+        p.first_name.toLowerCase().includes(q) ||
+        p.second_name.toLowerCase().includes(q)
+      )
+    ) {
+      continue;
+    }
+    if (positionId !== undefined && p.element_type !== positionId) continue;
+    if (teamId !== undefined && p.team !== teamId) continue;
+    if (maxCost !== undefined && p.now_cost > maxCost) continue;
+    if (minCost !== undefined && p.now_cost < minCost) continue;
+    if (minMinutes !== undefined && p.minutes < minMinutes) continue;
 
-  if (input.min_form !== undefined) {
-    players = players.filter((p) => parseFloat(p.form) >= input.min_form!);
-  }
+    const form = needsForm ? parseFloat(p.form) : NaN;
+    if (minForm !== undefined && !(form >= minForm)) continue;
 
-  if (input.min_minutes !== undefined) {
-    players = players.filter((p) => p.minutes >= input.min_minutes!);
+    players.push(p);
+    keys.push(sortBy === "form" ? form : getSortKey(p, sortBy));
   }
 
   const totalMatches = players.length;
 
-  // Sort
-  const sortBy = input.sort_by ?? "form";
-  players.sort((a, b) => {
-    switch (sortBy) {
-      case "form":
-        return parseFloat(b.form) - parseFloat(a.form);
-      case "total_points":
-        return b.total_points - a.total_points;
-      case "ep_next":
-        return parseFloat(b.ep_next) - parseFloat(a.ep_next);
-      case "price":
-        return b.now_cost - a.now_cost;
-      case "selected_by":
-        return parseFloat(b.selected_by_percent) - parseFloat(a.selected_by_percent);
-      default:
-        return parseFloat(b.form) - parseFloat(a.form);
-    }
-  });
-
-  // Limit results
+  // Limit results - select the top `limit` entries
   const limit = Math.min(input.limit ?? 10, 20);
-  players = players.slice(0, limit);
+  const topPlayerIndices = topIndices(keys, limit);
 
   // Enrich with next fixtures
-  const enrichedPlayers = players.map((p) => {
+  const nextFixtureCount = 3;
+  const fixtureIndex = indexFixturesByTeamAndGw(allFixtures, currentGw, currentGw + nextFixtureCount);
+  const enrichedPlayers = topPlayerIndices.map((i) => {
+    const p = players[i];
     const team = teamLookup.get(p.team);
-    const nextFixtures = getNextFixtures(p.team, currentGw, allFixtures, teamLookup, 3);
+    const nextFixtures = getNextFixtures(p.team, currentGw, fixtureIndex, teamLookup, nextFixtureCount);
 
     return {
       id: p.id,
@@ -198,17 +172,66 @@ export async function handleSearchPlayers(
   };
 }
 
+function getSortKey(player: FPLPlayer, sortBy: NonNullable<SearchPlayersInput["sort_by"]>): number {
+  switch (sortBy) {
+    case "form":
+      return parseFloat(player.form);
+    case "total_points":
+      return player.total_points;
+    case "ep_next":
+      return parseFloat(player.ep_next);
+    case "price":
+      return player.now_cost;
+    case "selected_by":
+      return parseFloat(player.selected_by_percent);
+    default:
+      return parseFloat(player.form);
+  }
+}
+
+// Indices of the k largest keys in descending order; ties keep the earlier index first (like a stable sort)
+function topIndices(keys: ArrayLike<number>, k: number): number[] {
+  const top: number[] = [];
+  for (let i = 0; i < keys.length; i++) {
+    const key = keys[i];
+    if (top.length >= k && !(key > keys[top[top.length - 1]])) continue;
+
+    let pos = top.length;
+    while (pos > 0 && key > keys[top[pos - 1]]) pos--;
+    top.splice(pos, 0, i);
+    if (top.length > k) top.pop();
+  }
+  return top;
+}
+
+// First fixture per team and gameweek within [fromGw, toGw], keyed by fixtureKey()
+function indexFixturesByTeamAndGw(fixtures: FPLFixture[], fromGw: number, toGw: number): Map<number, FPLFixture> {
+  const index = new Map<number, FPLFixture>();
+  for (const f of fixtures) {
+    if (f.event === null || f.event < fromGw || f.event > toGw) continue;
+    const homeKey = fixtureKey(f.team_h, f.event);
+    const awayKey = fixtureKey(f.team_a, f.event);
+    if (!index.has(homeKey)) index.set(homeKey, f);
+    if (!index.has(awayKey)) index.set(awayKey, f);
+  }
+  return index;
+}
+
+function fixtureKey(teamId: number, gw: number): number {
+  return teamId * 100 + gw;
+}
+
 function getNextFixtures(
   teamId: number,
   currentGw: number,
-  fixtures: FPLFixture[],
+  fixtureIndex: Map<number, FPLFixture>,
   teamLookup: Map<number, FPLTeam>,
   count: number
 ): Array<{ opponent: string; is_home: boolean; difficulty: number }> {
   const result: Array<{ opponent: string; is_home: boolean; difficulty: number }> = [];
 
   for (let gw = currentGw; gw <= Math.min(currentGw + count, 38) && result.length < count; gw++) {
-    const fixture = fixtures.find((f) => f.event === gw && (f.team_h === teamId || f.team_a === teamId));
+    const fixture = fixtureIndex.get(fixtureKey(teamId, gw));
 
     if (fixture) {
       const isHome = fixture.team_h === teamId;
@@ -293,6 +293,13 @@ export const POSITION_MAP: Record<number, "GK" | "DEF" | "MID" | "FWD"> = {
   4: "FWD",
 };
 
+export const POSITION_ID_MAP: Record<string, number> = {
+  GK: 1,
+  DEF: 2,
+  MID: 3,
+  FWD: 4,
+};
+
 // Community Trends types
 
 export interface TrendingPlayerSource {